@@ -9,9 +9,15 @@ load_dotenv()
 SLACK_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL", "")
 DRY_RUN = os.getenv("DRY_RUN", "false").lower() == "true"
 
+# Number of company boards fetched concurrently
+# Also sizes the HTTP connection pool so no worker waits on a connection
+FETCH_MAX_WORKERS = 32
+
+# Keyword lists below are tuples of lowercase strings
+
 # Job title keywords to INCLUDE (case-insensitive)
 # Focused on General Ledger / Corporate Accounting roles
-TITLE_INCLUDE_KEYWORDS = [
+TITLE_INCLUDE_KEYWORDS = (
     # Primary GL roles
     "gl accountant",
     "general ledger",
@@ -23,12 +29,12 @@ TITLE_INCLUDE_KEYWORDS = [
     "technical accounting",
     "accounting operations",
     "accounting analyst",
-]
+)
 
 # Job title keywords to EXCLUDE (case-insensitive)
 # Excludes manager/director level roles per requirements
 # Also excludes specialist roles not related to GL
-TITLE_EXCLUDE_KEYWORDS = [
+TITLE_EXCLUDE_KEYWORDS = (
     # Leadership roles
     "manager",
     "director",
@@ -61,12 +67,12 @@ TITLE_EXCLUDE_KEYWORDS = [
     "software engineer",
     "product",
     "data engineer",
-]
+)
 
 # Location keywords (case-insensitive)
 # Must match at least one to be included
 # Focused on San Francisco and Remote only
-LOCATION_KEYWORDS = [
+LOCATION_KEYWORDS = (
     # San Francisco
     "san francisco",
     "sf",
@@ -76,11 +82,11 @@ LOCATION_KEYWORDS = [
     "anywhere",
     "work from home",
     "wfh",
-]
+)
 
 # Keywords that indicate a US-based position
 # Used to filter remote jobs - must contain one of these to be included
-US_LOCATION_KEYWORDS = [
+US_LOCATION_KEYWORDS = (
     "united states",
     "usa",
     "us",
@@ -99,10 +105,10 @@ US_LOCATION_KEYWORDS = [
     "illinois",
     ", il",
     "north america",
-]
+)
 
 # Keywords that indicate an international (non-US) position - exclude these
-INTERNATIONAL_EXCLUDE_KEYWORDS = [
+INTERNATIONAL_EXCLUDE_KEYWORDS = (
     "uk",
     "united kingdom",
     "london",
@@ -122,7 +128,7 @@ INTERNATIONAL_EXCLUDE_KEYWORDS = [
     "apac",
     "latam",
     "europe",
-]
+)
 
 # Location priority tiers (lower = higher priority)
 # Used to sort jobs: SF first, Remote second
@@ -1,5 +1,34 @@
+import functools
+
+import requests
+
+from ..config import GREENHOUSE_COMPANIES, ASHBY_COMPANIES, LEVER_COMPANIES
 from .greenhouse import GreenhouseFetcher
 from .ashby import AshbyFetcher
 from .lever import LeverFetcher
 
-__all__ = ["GreenhouseFetcher", "AshbyFetcher", "LeverFetcher"]
+__all__ = ["GreenhouseFetcher", "AshbyFetcher", "LeverFetcher", "get_fetchers"]
+
+
+def get_fetchers(session: requests.Session = None) -> tuple:
+    """
+    Build (fetcher, company_name) pairs for every configured company.
+    Fetchers use the shared pooled session unless one is given; only the
+    default set is cached, so injected sessions are not kept alive.
+    """
+    if session is None:
+        return _default_fetchers()
+    return _build_fetchers(session)
+
+
+@functools.cache
+def _default_fetchers() -> tuple:
+    return _build_fetchers(None)
+
+
+def _build_fetchers(session: requests.Session = None) -> tuple:
+    return (
+        tuple((GreenhouseFetcher(slug, name, session), name) for slug, name in GREENHOUSE_COMPANIES) +
+        tuple((AshbyFetcher(slug, name, session), name) for slug, name in ASHBY_COMPANIES) +
+        tuple((LeverFetcher(slug, name, session), name) for slug, name in LEVER_COMPANIES)
+    )
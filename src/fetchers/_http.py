@@ -0,0 +1,37 @@
+"""Shared HTTP session for ATS API clients."""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..config import FETCH_MAX_WORKERS
+
+# Retry transient failures (rate limits, gateway errors) with backoff so a
+# single 429/5xx doesn't drop a whole company board from the run. Fetchers
+# only log once retries are exhausted.
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=True,
+)
+
+# A single pooled session lets concurrent fetches reuse keep-alive
+# connections to the same ATS host instead of opening a new TLS
+# connection for every company board.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        # pool_connections is the number of per-host pools kept (we only
+        # talk to a few ATS hosts), so it is deliberately not tied to the
+        # worker count; pool_maxsize is connections per host and must cover
+        # every concurrent worker
+        pool_connections=8,
+        pool_maxsize=FETCH_MAX_WORKERS,
+        max_retries=RETRY,
+    ),
+)
+
+# (connect, read) timeouts in seconds
+TIMEOUT = (5, 30)
@@ -1,20 +1,12 @@
 """Ashby ATS API client."""
 
+import sys
+import orjson
 import requests
-from dataclasses import dataclass
 from typing import Optional
 
-
-@dataclass
-class Job:
-    """Normalized job representation."""
-    id: str
-    title: str
-    company: str
-    location: str
-    url: str
-    posted_at: Optional[str] = None
-    department: Optional[str] = None
+from ..models import Job, intern_field
+from ._http import SESSION, TIMEOUT
 
 
 class AshbyFetcher:
@@ -22,18 +14,27 @@ class AshbyFetcher:
 
     BASE_URL = "https://api.ashbyhq.com/posting-api/job-board"
 
-    def __init__(self, company_slug: str, company_name: str):
+    def __init__(
+        self,
+        company_slug: str,
+        company_name: str,
+        session: requests.Session = None,
+    ):
         self.company_slug = company_slug
         self.company_name = company_name
+        self.session = session or SESSION
+        # Per-board prefixes, built once instead of formatted per job
+        self._id_prefix = f"ashby_{company_slug}_"
+        self._url_prefix = f"https://jobs.ashbyhq.com/{company_slug}/"
 
     def fetch_jobs(self) -> list[Job]:
         """Fetch all jobs from the company's Ashby board."""
         url = f"{self.BASE_URL}/{self.company_slug}"
 
         try:
-            response = requests.get(url, timeout=30)
+            response = self.session.get(url, timeout=TIMEOUT)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             job_postings = data.get("jobs", [])
 
@@ -45,24 +46,26 @@ class AshbyFetcher:
 
             return jobs
 
-        except requests.RequestException as e:
-            print(f"Error fetching jobs from {self.company_name}: {e}")
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            # Message and newline in one write so lines from concurrent
+            # fetches don't run together
+            sys.stdout.write(f"Error fetching jobs from {self.company_name}: {e}\n")
             return []
 
     def _parse_job(self, job_data: dict) -> Optional[Job]:
         """Parse a single job from Ashby API response."""
         try:
-            job_id = job_data.get("id")
+            job_id = str(job_data["id"])
 
             return Job(
-                id=f"ashby_{self.company_slug}_{job_id}",
+                id=self._id_prefix + job_id,
                 title=job_data.get("title", "Unknown Title"),
                 company=self.company_name,
-                location=job_data.get("location", "Unknown"),
-                url=job_data.get("jobUrl", f"https://jobs.ashbyhq.com/{self.company_slug}/{job_id}"),
+                location=intern_field(job_data.get("location", "Unknown")),
+                url=job_data.get("jobUrl") or self._url_prefix + job_id,
                 posted_at=job_data.get("publishedAt"),
-                department=job_data.get("department"),
+                department=intern_field(job_data.get("department")),
             )
         except Exception as e:
-            print(f"Error parsing job: {e}")
+            sys.stdout.write(f"Error parsing job: {e}\n")
             return None
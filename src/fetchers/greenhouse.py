@@ -1,20 +1,12 @@
 """Greenhouse ATS API client."""
 
+import sys
+import orjson
 import requests
-from dataclasses import dataclass
 from typing import Optional
 
-
-@dataclass
-class Job:
-    """Normalized job representation."""
-    id: str
-    title: str
-    company: str
-    location: str
-    url: str
-    posted_at: Optional[str] = None
-    department: Optional[str] = None
+from ..models import Job, intern_field
+from ._http import SESSION, TIMEOUT
 
 
 class GreenhouseFetcher:
@@ -22,18 +14,27 @@ class GreenhouseFetcher:
 
     BASE_URL = "https://boards-api.greenhouse.io/v1/boards"
 
-    def __init__(self, company_slug: str, company_name: str):
+    def __init__(
+        self,
+        company_slug: str,
+        company_name: str,
+        session: requests.Session = None,
+    ):
         self.company_slug = company_slug
         self.company_name = company_name
+        self.session = session or SESSION
+        # Per-board prefixes, built once instead of formatted per job
+        self._id_prefix = f"greenhouse_{company_slug}_"
+        self._url_prefix = f"https://boards.greenhouse.io/{company_slug}/jobs/"
 
     def fetch_jobs(self) -> list[Job]:
         """Fetch all jobs from the company's Greenhouse board."""
         url = f"{self.BASE_URL}/{self.company_slug}/jobs"
 
         try:
-            response = requests.get(url, timeout=30)
+            response = self.session.get(url, timeout=TIMEOUT)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             jobs = []
             for job_data in data.get("jobs", []):
@@ -43,8 +44,10 @@ class GreenhouseFetcher:
 
             return jobs
 
-        except requests.RequestException as e:
-            print(f"Error fetching jobs from {self.company_name}: {e}")
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            # Message and newline in one write so lines from concurrent
+            # fetches don't run together
+            sys.stdout.write(f"Error fetching jobs from {self.company_name}: {e}\n")
             return []
 
     def _parse_job(self, job_data: dict) -> Optional[Job]:
@@ -56,26 +59,24 @@ class GreenhouseFetcher:
             if isinstance(locations, dict):
                 location = locations.get("name", "Unknown")
 
-            # Build the application URL
-            job_id = job_data.get("id")
-            url = f"https://boards.greenhouse.io/{self.company_slug}/jobs/{job_id}"
+            job_id = str(job_data["id"])
 
             return Job(
-                id=f"greenhouse_{self.company_slug}_{job_id}",
+                id=self._id_prefix + job_id,
                 title=job_data.get("title", "Unknown Title"),
                 company=self.company_name,
-                location=location,
-                url=url,
+                location=intern_field(location),
+                url=self._url_prefix + job_id,
                 posted_at=job_data.get("updated_at"),
-                department=self._extract_department(job_data),
+                department=intern_field(self._extract_department(job_data)),
             )
         except Exception as e:
-            print(f"Error parsing job: {e}")
+            sys.stdout.write(f"Error parsing job: {e}\n")
             return None
 
     def _extract_department(self, job_data: dict) -> Optional[str]:
         """Extract department from job metadata."""
         departments = job_data.get("departments", [])
-        if departments and len(departments) > 0:
+        if departments:
             return departments[0].get("name")
         return None
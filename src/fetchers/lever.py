@@ -1,20 +1,12 @@
 """Lever ATS API client."""
 
+import sys
+import orjson
 import requests
-from dataclasses import dataclass
 from typing import Optional
 
-
-@dataclass
-class Job:
-    """Normalized job representation."""
-    id: str
-    title: str
-    company: str
-    location: str
-    url: str
-    posted_at: Optional[str] = None
-    department: Optional[str] = None
+from ..models import Job, intern_field
+from ._http import SESSION, TIMEOUT
 
 
 class LeverFetcher:
@@ -22,18 +14,26 @@ class LeverFetcher:
 
     BASE_URL = "https://api.lever.co/v0/postings"
 
-    def __init__(self, company_slug: str, company_name: str):
+    def __init__(
+        self,
+        company_slug: str,
+        company_name: str,
+        session: requests.Session = None,
+    ):
         self.company_slug = company_slug
         self.company_name = company_name
+        self.session = session or SESSION
+        # Per-board prefix, built once instead of formatted per job
+        self._id_prefix = f"lever_{company_slug}_"
 
     def fetch_jobs(self) -> list[Job]:
         """Fetch all jobs from the company's Lever board."""
         url = f"{self.BASE_URL}/{self.company_slug}"
 
         try:
-            response = requests.get(url, timeout=30)
+            response = self.session.get(url, timeout=TIMEOUT)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             jobs = []
             for job_data in data:
@@ -43,14 +43,16 @@ class LeverFetcher:
 
             return jobs
 
-        except requests.RequestException as e:
-            print(f"Error fetching jobs from {self.company_name}: {e}")
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            # Message and newline in one write so lines from concurrent
+            # fetches don't run together
+            sys.stdout.write(f"Error fetching jobs from {self.company_name}: {e}\n")
             return []
 
     def _parse_job(self, job_data: dict) -> Optional[Job]:
         """Parse a single job from Lever API response."""
         try:
-            job_id = job_data.get("id")
+            job_id = str(job_data["id"])
 
             # Extract location from categories
             location = "Unknown"
@@ -64,14 +66,14 @@ class LeverFetcher:
                 department = categories.get("team")
 
             return Job(
-                id=f"lever_{self.company_slug}_{job_id}",
+                id=self._id_prefix + job_id,
                 title=job_data.get("text", "Unknown Title"),
                 company=self.company_name,
-                location=location,
+                location=intern_field(location),
                 url=job_data.get("hostedUrl", ""),
                 posted_at=str(job_data.get("createdAt", "")),
-                department=department,
+                department=intern_field(department),
             )
         except Exception as e:
-            print(f"Error parsing job: {e}")
+            sys.stdout.write(f"Error parsing job: {e}\n")
             return None
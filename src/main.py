@@ -3,75 +3,43 @@
 
 import sys
 import argparse
-from dataclasses import dataclass
-from typing import Optional
-
-from .config import (
-    GREENHOUSE_COMPANIES,
-    ASHBY_COMPANIES,
-    LEVER_COMPANIES,
-)
-from .fetchers import GreenhouseFetcher, AshbyFetcher, LeverFetcher
-from .processor import JobProcessor
-from .storage import JobStorage
-from .notifier import EmailNotifier
-
-
-@dataclass
-class Job:
-    """Normalized job representation."""
-    id: str
-    title: str
-    company: str
-    location: str
-    url: str
-    posted_at: Optional[str] = None
-    department: Optional[str] = None
-
-
-def fetch_all_jobs() -> list[Job]:
-    """Fetch jobs from all configured companies."""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .models import Job
+
+_BANNER = "=" * 60
+_SEP = "-" * 60
+
+
+def fetch_all_jobs(session=None) -> list[Job]:
+    """
+    Fetch jobs from all configured companies concurrently.
+    Pass a requests.Session to override the shared pooled session.
+    """
+    from .config import FETCH_MAX_WORKERS
+    from .fetchers import get_fetchers
+
     all_jobs = []
 
-    # Fetch from Greenhouse companies
-    print(f"\nFetching from {len(GREENHOUSE_COMPANIES)} Greenhouse companies...")
-    for slug, name in GREENHOUSE_COMPANIES:
-        fetcher = GreenhouseFetcher(slug, name)
-        jobs = fetcher.fetch_jobs()
-        # Convert to common Job type
-        for j in jobs:
-            all_jobs.append(Job(
-                id=j.id, title=j.title, company=j.company,
-                location=j.location, url=j.url,
-                posted_at=j.posted_at, department=j.department
-            ))
-        print(f"  {name}: {len(jobs)} jobs")
-
-    # Fetch from Ashby companies
-    print(f"\nFetching from {len(ASHBY_COMPANIES)} Ashby companies...")
-    for slug, name in ASHBY_COMPANIES:
-        fetcher = AshbyFetcher(slug, name)
-        jobs = fetcher.fetch_jobs()
-        for j in jobs:
-            all_jobs.append(Job(
-                id=j.id, title=j.title, company=j.company,
-                location=j.location, url=j.url,
-                posted_at=j.posted_at, department=j.department
-            ))
-        print(f"  {name}: {len(jobs)} jobs")
-
-    # Fetch from Lever companies
-    print(f"\nFetching from {len(LEVER_COMPANIES)} Lever companies...")
-    for slug, name in LEVER_COMPANIES:
-        fetcher = LeverFetcher(slug, name)
-        jobs = fetcher.fetch_jobs()
-        for j in jobs:
-            all_jobs.append(Job(
-                id=j.id, title=j.title, company=j.company,
-                location=j.location, url=j.url,
-                posted_at=j.posted_at, department=j.department
-            ))
-        print(f"  {name}: {len(jobs)} jobs")
+    tasks = get_fetchers(session)
+
+    # Each fetch is a single blocking HTTP request, so run them in a thread pool
+    print(f"\nFetching from {len(tasks)} companies...")
+    job_counts = [0] * len(tasks)
+    with ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(fetcher.fetch_jobs): i
+            for i, (fetcher, _) in enumerate(tasks)
+        }
+        for future in as_completed(futures):
+            jobs = future.result()
+            all_jobs.extend(jobs)
+            job_counts[futures[future]] = len(jobs)
+
+    # Report per-company counts in one write, in config order
+    sys.stdout.write("".join(
+        f"  {name}: {count} jobs\n" for (_, name), count in zip(tasks, job_counts)
+    ))
 
     return all_jobs
 
@@ -96,9 +64,19 @@ def main():
     )
     args = parser.parse_args()
 
-    print("=" * 60)
+    # Deferred so --help doesn't pay for loading .env and the HTTP stack
+    from .config import (
+        GREENHOUSE_COMPANIES,
+        ASHBY_COMPANIES,
+        LEVER_COMPANIES,
+    )
+    from .processor import JobProcessor
+    from .storage import JobStorage
+    from .notifier import SlackNotifier
+
+    print(_BANNER)
     print("Job Search Agent")
-    print("=" * 60)
+    print(_BANNER)
 
     # Calculate total companies
     total_companies = (
@@ -111,7 +89,7 @@ def main():
     # Initialize components
     processor = JobProcessor()
     storage = JobStorage()
-    notifier = EmailNotifier(dry_run=args.dry_run)
+    notifier = SlackNotifier(dry_run=args.dry_run)
 
     # Reset history if requested
     if args.reset_history:
@@ -124,32 +102,29 @@ def main():
     all_jobs = fetch_all_jobs()
     print(f"\nTotal jobs fetched: {len(all_jobs)}")
 
-    # Filter jobs
+    # Filter and deduplicate
     if args.no_filter:
-        filtered_jobs = all_jobs
         print(f"Skipping filters (--no-filter)")
+        unique_jobs = processor.deduplicate(all_jobs)
+        print(f"After deduplication: {len(unique_jobs)}")
     else:
-        filtered_jobs = processor.filter_jobs(all_jobs)
-        print(f"Jobs matching criteria: {len(filtered_jobs)}")
-
-    # Deduplicate
-    unique_jobs = processor.deduplicate(filtered_jobs)
-    print(f"After deduplication: {len(unique_jobs)}")
+        unique_jobs = processor.filter_and_dedupe(all_jobs)
+        print(f"Jobs matching criteria (deduplicated): {len(unique_jobs)}")
 
     # Sort by location priority (SF first, Remote second), then date
     all_sorted = processor.sort_by_location_then_date(unique_jobs)
 
     # Print summary
-    print("\n" + "-" * 60)
+    print("\n" + _SEP)
     print(f"ALL OPEN POSITIONS ({len(all_sorted)}):")
-    print("-" * 60)
+    print(_SEP)
     for job in all_sorted[:20]:
         print(f"  - {job.title} @ {job.company}")
     if len(all_sorted) > 20:
         print(f"  ... and {len(all_sorted) - 20} more")
 
     # Send Slack notification
-    print("\n" + "=" * 60)
+    print("\n" + _BANNER)
     print("Sending notification...")
     success = notifier.send_digest(
         all_jobs=all_sorted,
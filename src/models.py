@@ -0,0 +1,25 @@
+"""Shared data models."""
+
+import sys
+from dataclasses import dataclass
+from typing import Optional
+
+
+def intern_field(value: Optional[str]) -> Optional[str]:
+    """
+    Intern a low-cardinality Job field (location, department) so repeated
+    values across postings share one string object. Non-strings pass through.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True, frozen=True)
+class Job:
+    """Normalized job representation."""
+    id: str
+    title: str
+    company: str
+    location: str
+    url: str
+    posted_at: Optional[str] = None
+    department: Optional[str] = None
@@ -1,26 +1,24 @@
 """Slack notification service."""
 
-import os
-import json
 import requests
 from datetime import datetime
-from dataclasses import dataclass
-from typing import Optional
 
 from .config import SLACK_WEBHOOK_URL, DRY_RUN
+from .models import Job
 from .processor import is_general_ledger_job
 
+# Slack mrkdwn treats &, < and > as control characters; escape them in
+# job fields so titles like "R&D Accountant" don't break the message
+_SLACK_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
 
-@dataclass
-class Job:
-    """Normalized job representation."""
-    id: str
-    title: str
-    company: str
-    location: str
-    url: str
-    posted_at: Optional[str] = None
-    department: Optional[str] = None
+
+def _escape(value) -> str:
+    """Escape a job field for mrkdwn; None renders as "None" like before."""
+    return str(value).translate(_SLACK_ESCAPE)
+
+
+# Static footer text, identical on every digest
+_FOOTER_TEXT = "GL/Accountant roles · SF & Remote · Good luck! 🍀"
 
 
 class SlackNotifier:
@@ -99,7 +97,11 @@ class SlackNotifier:
         lines = []
         for job in all_jobs:
             gl_tag = " `GL`" if is_general_ledger_job(job) else ""
-            lines.append(f"• <{job.url}|{job.title}>{gl_tag} — *{job.company}* · {job.location}")
+            url = _escape(job.url)
+            title = _escape(job.title)
+            company = _escape(job.company)
+            location = _escape(job.location)
+            lines.append(f"• <{url}|{title}>{gl_tag} — *{company}* · {location}")
 
         # Split into chunks of 20 to stay readable
         chunk_size = 20
@@ -110,18 +112,11 @@ class SlackNotifier:
                 "text": {"type": "mrkdwn", "text": chunk}
             })
 
-        # Footer
+        # Footer (fresh dicts each send so callers can safely edit the payload)
         blocks.append({"type": "divider"})
         blocks.append({
             "type": "context",
-            "elements": [{
-                "type": "mrkdwn",
-                "text": f"GL/Accountant roles · SF & Remote · Good luck! 🍀"
-            }]
+            "elements": [{"type": "mrkdwn", "text": _FOOTER_TEXT}]
         })
 
         return blocks
-
-
-# Keep old name as alias so main.py import doesn't break
-EmailNotifier = SlackNotifier
@@ -1,7 +1,7 @@
 """Job filtering and processing logic."""
 
-from dataclasses import dataclass
-from typing import Optional
+import re
+import functools
 from datetime import datetime
 from .config import (
     TITLE_INCLUDE_KEYWORDS,
@@ -11,24 +11,43 @@ from .config import (
     US_LOCATION_KEYWORDS,
     INTERNATIONAL_EXCLUDE_KEYWORDS,
 )
-
-
-@dataclass
-class Job:
-    """Normalized job representation."""
-    id: str
-    title: str
-    company: str
-    location: str
-    url: str
-    posted_at: Optional[str] = None
-    department: Optional[str] = None
+from .models import Job
+
+
+def _compile_keywords(keywords: tuple[str, ...]) -> re.Pattern:
+    """
+    Compile keywords into a single case-insensitive alternation pattern so a
+    text is scanned once instead of once per keyword, without lowercasing it.
+    Keywords are normalised to lowercase here and nowhere else.
+    An empty keyword list compiles to a pattern that never matches.
+    """
+    if not keywords:
+        return re.compile(r"(?!)")
+    return re.compile(
+        "|".join(re.escape(k.lower()) for k in keywords),
+        re.IGNORECASE,
+    )
+
+
+# Location sets are fixed, so compile them once at import
+_US_LOCATION_RE = _compile_keywords(US_LOCATION_KEYWORDS)
+_INTERNATIONAL_RE = _compile_keywords(INTERNATIONAL_EXCLUDE_KEYWORDS)
+_SAN_FRANCISCO_RE = _compile_keywords(("san francisco", "sf"))
+_GENERAL_LEDGER_RE = _compile_keywords(("general ledger", "gl accountant"))
+
+# One pattern per LOCATION_PRIORITY tier, best (lowest) tier first
+_LOCATION_TIERS = tuple(
+    (priority, _compile_keywords(tuple(
+        keyword for keyword, p in LOCATION_PRIORITY.items() if p == priority
+    )))
+    for priority in sorted(set(LOCATION_PRIORITY.values()))
+)
 
 
 def is_general_ledger_job(job: Job) -> bool:
     """Check if a job specifically mentions general ledger in title or department."""
-    text_to_check = f"{job.title} {job.department or ''}".lower()
-    return "general ledger" in text_to_check or "gl accountant" in text_to_check
+    text_to_check = f"{job.title} {job.department or ''}"
+    return _GENERAL_LEDGER_RE.search(text_to_check) is not None
 
 
 class JobProcessor:
@@ -36,19 +55,16 @@ class JobProcessor:
 
     def __init__(
         self,
-        include_keywords: list[str] = None,
-        exclude_keywords: list[str] = None,
-        location_keywords: list[str] = None,
+        include_keywords: tuple[str, ...] = None,
+        exclude_keywords: tuple[str, ...] = None,
+        location_keywords: tuple[str, ...] = None,
     ):
-        self.include_keywords = [
-            k.lower() for k in (include_keywords or TITLE_INCLUDE_KEYWORDS)
-        ]
-        self.exclude_keywords = [
-            k.lower() for k in (exclude_keywords or TITLE_EXCLUDE_KEYWORDS)
-        ]
-        self.location_keywords = [
-            k.lower() for k in (location_keywords or LOCATION_KEYWORDS)
-        ]
+        self.include_keywords = tuple(include_keywords or TITLE_INCLUDE_KEYWORDS)
+        self.exclude_keywords = tuple(exclude_keywords or TITLE_EXCLUDE_KEYWORDS)
+        self.location_keywords = tuple(location_keywords or LOCATION_KEYWORDS)
+        self._include_re = _compile_keywords(self.include_keywords)
+        self._exclude_re = _compile_keywords(self.exclude_keywords)
+        self._location_re = _compile_keywords(self.location_keywords)
 
     def filter_jobs(self, jobs: list[Job]) -> list[Job]:
         """Filter jobs based on title and location criteria."""
@@ -58,8 +74,26 @@ class JobProcessor:
                 filtered.append(job)
         return filtered
 
+    def filter_and_dedupe(self, jobs: list[Job]) -> list[Job]:
+        """
+        Filter jobs and drop duplicate URLs in a single pass.
+        Equivalent to deduplicate(filter_jobs(jobs)) without the
+        intermediate list.
+        """
+        seen_urls = set()
+        unique_jobs = []
+        for job in jobs:
+            if job.url in seen_urls or not self._matches_criteria(job):
+                continue
+            seen_urls.add(job.url)
+            unique_jobs.append(job)
+        return unique_jobs
+
     def _matches_criteria(self, job: Job) -> bool:
         """Check if a job matches all filter criteria."""
+        # Ordered cheapest/most selective first: almost every posting on a
+        # board fails the include list, and the location check is the most
+        # expensive (up to four pattern searches)
         return (
             self._matches_title_include(job.title) and
             not self._matches_title_exclude(job.title) and
@@ -68,13 +102,11 @@ class JobProcessor:
 
     def _matches_title_include(self, title: str) -> bool:
         """Check if title contains any include keyword."""
-        title_lower = title.lower()
-        return any(keyword in title_lower for keyword in self.include_keywords)
+        return self._include_re.search(title) is not None
 
     def _matches_title_exclude(self, title: str) -> bool:
         """Check if title contains any exclude keyword."""
-        title_lower = title.lower()
-        return any(keyword in title_lower for keyword in self.exclude_keywords)
+        return self._exclude_re.search(title) is not None
 
     def _matches_location(self, location: str) -> bool:
         """
@@ -84,32 +116,28 @@ class JobProcessor:
         """
         if not location:
             return False
-        location_lower = location.lower()
 
-        # Check if it matches any location keyword (SF or Remote)
-        matches_keyword = any(keyword in location_lower for keyword in self.location_keywords)
-        if not matches_keyword:
+        # Check if it matches any location keyword (SF or Remote); patterns
+        # are case-insensitive, so the location is searched as-is
+        if not self._location_re.search(location):
             return False
 
         # If it's a San Francisco job, always include
-        if "san francisco" in location_lower or "sf" in location_lower:
+        if _SAN_FRANCISCO_RE.search(location):
             return True
 
         # For remote jobs, check if it's US-based
         # Exclude if it contains international keywords
-        intl_keywords = [k.lower() for k in INTERNATIONAL_EXCLUDE_KEYWORDS]
-        if any(keyword in location_lower for keyword in intl_keywords):
+        if _INTERNATIONAL_RE.search(location):
             return False
 
-        # Include if it contains US keywords, or if location is generic "Remote"
-        us_keywords = [k.lower() for k in US_LOCATION_KEYWORDS]
-        has_us_indicator = any(keyword in location_lower for keyword in us_keywords)
+        # Include if it contains US keywords
+        if _US_LOCATION_RE.search(location):
+            return True
 
         # Accept generic "Remote" without country specification (likely US company)
         # But reject if it explicitly mentions non-US locations
-        is_generic_remote = location_lower.strip() in ["remote", "hybrid", "remote - us", "us remote"]
-
-        return has_us_indicator or is_generic_remote
+        return location.strip().lower() in ("remote", "hybrid", "remote - us", "us remote")
 
     def deduplicate(self, jobs: list[Job]) -> list[Job]:
         """Remove duplicate jobs based on URL."""
@@ -132,7 +160,9 @@ class JobProcessor:
             return job.posted_at or ""
         return sorted(jobs, key=get_date_key, reverse=True)
 
-    def _get_location_priority(self, location: str) -> int:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _get_location_priority(location: str) -> int:
         """
         Get priority score for a location (lower = higher priority).
         Returns:
@@ -144,17 +174,20 @@ class JobProcessor:
         if not location:
             return 999
 
-        location_lower = location.lower()
-        best_priority = 999
+        # Tiers are checked best-first, so the first match is the minimum
+        for priority, pattern in _LOCATION_TIERS:
+            if pattern.search(location):
+                return priority
 
-        for keyword, priority in LOCATION_PRIORITY.items():
-            if keyword in location_lower:
-                best_priority = min(best_priority, priority)
+        return 999
 
-        return best_priority
-
-    def _date_to_timestamp(self, date_str: str) -> int:
-        """Convert date string to Unix timestamp for sorting."""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _date_to_timestamp(date_str: str) -> int:
+        """
+        Convert date string to Unix timestamp for sorting.
+        Cached because postings on a board often share timestamps.
+        """
         if not date_str:
             return 0
         try:
@@ -1,22 +1,11 @@
 """Job history storage for tracking seen jobs."""
 
-import json
 import os
+import orjson
 from datetime import datetime
-from dataclasses import dataclass
 from typing import Optional
 
-
-@dataclass
-class Job:
-    """Normalized job representation."""
-    id: str
-    title: str
-    company: str
-    location: str
-    url: str
-    posted_at: Optional[str] = None
-    department: Optional[str] = None
+from .models import Job
 
 
 class JobStorage:
@@ -31,22 +20,26 @@ class JobStorage:
         """Load job history from file."""
         if os.path.exists(self.storage_path):
             try:
-                with open(self.storage_path, "r") as f:
-                    data = json.load(f)
+                with open(self.storage_path, "rb") as f:
+                    data = orjson.loads(f.read())
                     self.seen_jobs = data.get("jobs", {})
-            except (json.JSONDecodeError, IOError) as e:
+            except (orjson.JSONDecodeError, IOError) as e:
                 print(f"Warning: Could not load job history: {e}")
                 self.seen_jobs = {}
 
     def _save(self):
-        """Save job history to file."""
+        """Save job history to file, atomically replacing the previous copy."""
         try:
             data = {
                 "last_updated": datetime.utcnow().isoformat(),
                 "jobs": self.seen_jobs,
             }
-            with open(self.storage_path, "w") as f:
-                json.dump(data, f, indent=2)
+            # Write to a temp file first so a crash mid-write can't leave
+            # a truncated history behind
+            tmp_path = f"{self.storage_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_path, self.storage_path)
         except IOError as e:
             print(f"Warning: Could not save job history: {e}")
 
@@ -73,25 +66,23 @@ class JobStorage:
         current_job_ids = {job.id for job in current_jobs}
 
         # Remove jobs that are no longer open
-        closed_jobs = [
-            job_id for job_id in self.seen_jobs
-            if job_id not in current_job_ids
-        ]
+        closed_jobs = self.seen_jobs.keys() - current_job_ids
         for job_id in closed_jobs:
             del self.seen_jobs[job_id]
 
         if closed_jobs:
             print(f"Removed {len(closed_jobs)} closed/filled jobs from history")
 
-        # Add new jobs
+        # Add new jobs, stamping the whole batch with the same time
         new_count = 0
+        now = datetime.utcnow().isoformat()
         for job in current_jobs:
             if job.id not in self.seen_jobs:
                 self.seen_jobs[job.id] = {
                     "title": job.title,
                     "company": job.company,
                     "url": job.url,
-                    "first_seen": datetime.utcnow().isoformat(),
+                    "first_seen": now,
                 }
                 new_count += 1
 